@@ -13,9 +13,212 @@ import time
 import re
 import csv
 import os
+import functools
+import itertools
+import traceback
 from datetime import datetime
 from PIL import ImageGrab, Image
 import queue
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# 限制Tesseract内部的OpenMP线程数：并行识别时每个工作线程/进程
+# 保持单线程，避免线程数爆炸互相争抢CPU
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# 优先使用程序目录下的tessdata_fast模型（整数化的fast版LSTM，
+# 推理比默认tessdata快约3倍，识别仪表数字精度足够）。必须在
+# pytesseract/tesserocr首次加载前设置TESSDATA_PREFIX才生效。
+_TESSDATA_FAST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tessdata_fast')
+if ('TESSDATA_PREFIX' not in os.environ
+        and os.path.exists(os.path.join(_TESSDATA_FAST_DIR, 'eng.traineddata'))):
+    os.environ['TESSDATA_PREFIX'] = _TESSDATA_FAST_DIR
+    print(f"[DEBUG] 使用fast模型目录: {_TESSDATA_FAST_DIR}")
+
+# 每帧调试输出开关：热路径上的print是同步IO，会明显拖慢监控循环
+# （尤其是打包成exe后的控制台），默认关闭，排查问题时置OCR_DEBUG=1
+DEBUG = os.environ.get('OCR_DEBUG', '') == '1'
+
+# OCR识别配置：parse_value最终只取数字/小数点，没必要带着chi_sim
+# 的大模型跑完整LSTM搜索——限定eng+字符白名单后，候选类别从几千个
+# 缩到十来个，模型加载和单帧识别都快得多。"计数率"等前缀本来就是
+# 可选匹配，丢掉标签文字不影响数值解析。
+OCR_LANG = 'eng'
+OCR_WHITELIST = '0123456789.'
+OCR_CONFIG = f'--oem 1 --psm 7 -c tessedit_char_whitelist={OCR_WHITELIST}'
+
+# OCR输入图像的最大高度：Tesseract内部会把文字行重缩放到约30px，
+# HiDPI屏幕上按原生分辨率抓取的区域可能是其2-4倍，超过这个高度
+# 只会增加拷贝和识别耗时，不会提高识别率。
+OCR_MAX_HEIGHT = 64
+
+# OCR输入图像的最小高度：太小的选区（小字号仪表读数）文字高度可能
+# 只有十几像素，低于Tesseract的有效识别尺寸，先放大到等效300DPI
+# 左右的字高再识别，准确率明显更高
+OCR_MIN_HEIGHT = 32
+
+# 数值解析正则：把原来的7条模式合并为单个交替式，整段文本只扫描一次。
+# 分组序号即优先级（组1最高），模块加载时编译一次。
+VALUE_PATTERN = re.compile(
+    r'计数率[：:]\s*(\d+\.?\d*)\s*cps'
+    r'|(\d+\.?\d*)\s*cps'
+    r'|计数率[：:]\s*(\d+\.?\d*)'
+    r'|Rate[：:]\s*(\d+\.?\d*)'
+    r'|数值[：:]\s*(\d+\.?\d*)'
+    r'|(\d{1,6}\.?\d{0,2})'  # 匹配1-6位整数加可选小数部分
+    r'|\b(\d+\.?\d*)\b',  # 匹配独立的数字
+    re.IGNORECASE)
+
+def _segment_glyphs(image, np):
+    """把二值化图像按空白列切分为字形位图列表，无法分段返回None
+
+    固定字体的仪表显示里，同一字符的二值化位图逐帧完全一致，
+    按列投影分段+逐字形精确匹配即可替代完整的LSTM识别。
+    """
+    arr = np.asarray(image)
+    if arr.ndim != 2 or arr.size == 0:
+        return None
+
+    # 统一为"笔画为True"：少数色视作笔画
+    ink = arr < 128
+    if ink.mean() > 0.5:
+        ink = ~ink
+    cols = ink.any(axis=0)
+    if not cols.any():
+        return None
+
+    # 连续非空白列段的起止位置
+    edges = np.flatnonzero(np.diff(np.concatenate(
+        (np.zeros(1, np.int8), cols.astype(np.int8), np.zeros(1, np.int8)))))
+
+    glyphs = []
+    for start, stop in zip(edges[::2], edges[1::2]):
+        seg = ink[:, start:stop]
+        rows = seg.any(axis=1)
+        top = int(np.argmax(rows))
+        bottom = len(rows) - int(np.argmax(rows[::-1]))
+        glyphs.append(np.ascontiguousarray(seg[top:bottom]))
+    return glyphs
+
+
+def _glyph_key(glyph):
+    """字形位图的精确匹配键（尺寸+像素内容）"""
+    return (glyph.shape, glyph.tobytes())
+
+
+@functools.lru_cache(maxsize=256)
+def _binarize_lut(threshold):
+    """按阈值生成二值化查找表（缓存复用，阈值稳定时不重建列表）"""
+    return [0] * (threshold + 1) + [255] * (255 - threshold)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_font_names():
+    """可用字体名集合（模块级缓存，fontManager字体表只扫描一次）"""
+    import matplotlib.font_manager as fm
+    return frozenset(f.name for f in fm.fontManager.ttflist)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_screen_scale_factor():
+    """获取屏幕缩放比例并设置进程DPI感知
+
+    结果缓存为模块级常量：SetProcessDpiAwareness是进程级一次性
+    设置，重复调用ctypes只是浪费。DPI感知生效后Tk事件坐标即物理
+    像素，选区坐标无需再乘缩放比例；只有老系统设置失败时坐标才是
+    逻辑像素。
+    """
+    dpi_aware = False
+    try:
+        # 尝试获取Windows缩放比例
+        import ctypes
+        try:
+            # Windows 8.1及以上
+            ctypes.windll.shcore.SetProcessDpiAwareness(1)
+            scale_factor = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100
+            dpi_aware = True
+        except:
+            # 老版本Windows退而求其次
+            try:
+                ctypes.windll.user32.SetProcessDPIAware()
+                dpi_aware = True
+            except:
+                pass
+            scale_factor = 1.0
+    except:
+        scale_factor = 1.0
+
+    print(f"[DEBUG] 屏幕缩放比例: {scale_factor}, DPI感知: {dpi_aware}")
+    return scale_factor, dpi_aware
+
+
+def _otsu_threshold(histogram):
+    """对256级灰度直方图计算Otsu阈值（类间方差最大化）"""
+    total = sum(histogram)
+    if total == 0:
+        return 127
+    sum_all = 0.0
+    for i, h in enumerate(histogram):
+        sum_all += i * h
+    sum_bg = 0.0
+    weight_bg = 0
+    best_threshold = 127
+    best_variance = 0.0
+    for i in range(256):
+        weight_bg += histogram[i]
+        if weight_bg == 0:
+            continue
+        weight_fg = total - weight_bg
+        if weight_fg == 0:
+            break
+        sum_bg += i * histogram[i]
+        mean_diff = sum_bg / weight_bg - (sum_all - sum_bg) / weight_fg
+        variance = weight_bg * weight_fg * mean_diff * mean_diff
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = i
+    return best_threshold
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_text_value(text):
+    """从OCR文本中解析数值，返回(优先级, 数值)，无匹配返回(None, None)
+
+    纯函数，结果按文本缓存：仪表读数稳定时相邻采样的OCR文本往往
+    完全相同，缓存命中可以省掉整个正则扫描。
+    """
+    # 单次扫描所有候选匹配，按分组序号（优先级）取最优
+    best_priority = None
+    best_value = None
+    for match in VALUE_PATTERN.finditer(text):
+        priority = match.lastindex
+        value = float(match.group(priority))
+
+        # 检查数值合理性（0-100000的范围比较合理）
+        if not 0 <= value <= 100000:
+            continue
+
+        if best_priority is None or priority < best_priority:
+            best_priority = priority
+            best_value = value
+            if priority == 1:
+                break  # 已是最高优先级
+
+    return best_priority, best_value
+
+
+def _ocr_region_worker(image_bytes, size, mode, tesseract_cmd):
+    """子进程OCR工作函数：重建图像并调用pytesseract识别
+
+    运行在独立进程中，绕过GIL，多通道识别可以真正并行。
+    参数必须可pickle，所以传原始像素而不是PIL对象句柄。
+    """
+    import pytesseract
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+    image = Image.frombytes(mode, size, image_bytes)
+    return pytesseract.image_to_string(image, lang=OCR_LANG, config=OCR_CONFIG)
+
 
 def check_dependencies():
     """检查并报告依赖状态"""
@@ -46,7 +249,25 @@ def check_dependencies():
         deps['opencv-python'] = 'AVAILABLE (not needed)'
     except ImportError:
         deps['opencv-python'] = 'NOT INSTALLED (not needed)'
-        
+
+    try:
+        import tesserocr
+        deps['tesserocr'] = 'AVAILABLE (faster OCR)'
+    except ImportError:
+        deps['tesserocr'] = 'NOT INSTALLED (optional)'
+
+    try:
+        import mss
+        deps['mss'] = 'AVAILABLE (faster capture)'
+    except ImportError:
+        deps['mss'] = 'NOT INSTALLED (optional)'
+
+    try:
+        import pytessy
+        deps['pytessy'] = 'AVAILABLE (faster OCR)'
+    except ImportError:
+        deps['pytessy'] = 'NOT INSTALLED (optional)'
+
     return deps
 
 class ScreenOCROrMonitor:
@@ -55,7 +276,10 @@ class ScreenOCROrMonitor:
         self.deps = check_dependencies()
         missing = [dep for dep, status in self.deps.items() if 'MISSING' in status]
         if missing:
-            messagebox.showerror("依赖缺失", f"缺少必要的依赖库：\n{', '.join(missing)}\n\n请运行：pip install -r requirements.txt")
+            messagebox.showerror("依赖缺失", f"缺少必要的依赖库：\n{', '.join(missing)}\n\n"
+                                 "请运行：pip install -r requirements.txt\n\n"
+                                 "建议：把tessdata_fast版的eng.traineddata放到程序目录的\n"
+                                 "tessdata_fast文件夹下，识别速度可提升约3倍")
             return
             
         # 导入必要依赖
@@ -95,7 +319,10 @@ class ScreenOCROrMonitor:
         self.monitoring = False
         self.channels = []  # 多通道数据
         self.active_channel_index = 0  # 当前活动通道
-        self.data_queue = queue.Queue()
+        # 数据队列：单锁保护的deque，生产端每tick批量extend一次，
+        # 消费端一次性换出，锁开销从每点一次摊薄到每tick一次
+        self.data_queue = deque(maxlen=4096)
+        self._data_lock = threading.Lock()
         self.interval = 2.0
         self.max_points = 1000
         
@@ -109,39 +336,48 @@ class ScreenOCROrMonitor:
         # 区域选择相关变量
         self.region_windows = []  # 存储区域选择窗口引用
         self.region_rectangles = {}  # 存储区域矩形引用 {channel_index: rect_id}
+        self._hull_rect = None  # 所有通道区域的外接矩形，通道增删时重算
+        self._rects_arr = None  # 全部通道rect的连续int32数组，与channels同步重建
+
+        # mss抓屏实例按线程惰性创建（mss实例不是线程安全的）
+        self._sct_local = threading.local()
+        self._sct_failed = False
         
         # 获取屏幕缩放比例
-        self.scale_factor = self.get_screen_scale_factor()
+        self.scale_factor, dpi_aware = self.get_screen_scale_factor()
+        # DPI感知生效时Tk事件坐标已是物理像素；只有设置失败的老系统
+        # 才需要把逻辑坐标乘回缩放比例
+        self._sx = self._sy = 1.0 if dpi_aware else self.scale_factor
         
         # 数据同步验证
         self.last_processed_count = 0
+
+        # 图表脏标记：数据摄取与渲染解耦，渲染按固定节奏进行
+        self._chart_dirty = False
+
+        # 队列清空调度状态：OCR线程产出数据时即时唤醒主线程清队，
+        # 不再固定100ms轮询空转
+        self._drain_scheduled = False
+        self._drain_timer = None
         
         # 图表渲染锁
         self._chart_update_lock = threading.Lock()
         
         # Tesseract路径设置
         self.setup_tesseract()
-        
+
+        # OCR后端选择
+        self.setup_ocr_backend()
+
         # 创建界面
         self.create_widgets()
-        
+
+        # 窗口关闭时释放OCR后端资源
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def get_screen_scale_factor(self):
-        """获取屏幕缩放比例"""
-        try:
-            # 尝试获取Windows缩放比例
-            import ctypes
-            try:
-                # Windows 8.1及以上
-                ctypes.windll.shcore.SetProcessDpiAwareness(1)
-                scale_factor = ctypes.windll.shcore.GetScaleFactorForDevice(0) / 100
-            except:
-                # 老版本Windows或其他系统
-                scale_factor = 1.0
-        except:
-            scale_factor = 1.0
-            
-        print(f"[DEBUG] 屏幕缩放比例: {scale_factor}")
-        return scale_factor
+        """获取屏幕缩放比例（模块级缓存，DPI设置只做一次）"""
+        return _get_screen_scale_factor()
     
     def setup_tesseract(self):
         """设置Tesseract路径"""
@@ -160,12 +396,64 @@ class ScreenOCROrMonitor:
         except Exception:
             pass
     
+    def setup_ocr_backend(self):
+        """选择OCR后端，优先级：tesserocr > pytessy > pytesseract
+
+        tesserocr保持一个常驻的PyTessBaseAPI实例：语言模型只在启动时
+        加载一次，之后每次识别都复用同一实例，省掉pytesseract每帧
+        spawn tesseract子进程并重载chi_sim+eng模型的开销。监控区域是
+        小块数字显示，用SINGLE_LINE页面分割跳过完整版面分析。
+        """
+        self.tess_api = None
+        self._pytessy = None
+        try:
+            from tesserocr import PyTessBaseAPI, PSM
+            self.tess_api = PyTessBaseAPI(lang=OCR_LANG, psm=PSM.SINGLE_LINE)
+            # 数字白名单：LSTM束搜索只在十来个字符类别间进行
+            self.tess_api.SetVariable('tessedit_char_whitelist', OCR_WHITELIST)
+            print("[DEBUG] OCR后端: tesserocr (常驻API实例)")
+            return
+        except Exception as e:
+            print(f"[DEBUG] tesserocr不可用: {e}")
+        try:
+            from pytessy import PyTessy
+            self._pytessy = PyTessy()
+            print("[DEBUG] OCR后端: pytessy (ctypes常驻实例)")
+        except Exception as e:
+            print(f"[DEBUG] OCR后端: pytesseract (子进程), pytessy不可用: {e}")
+
+    def _ocr_image(self, image):
+        """对预处理后的灰度图执行OCR，返回识别文本"""
+        if self.tess_api is not None:
+            try:
+                self.tess_api.SetImage(image)
+                return self.tess_api.GetUTF8Text() or ''
+            except Exception as e:
+                print(f"[DEBUG] tesserocr识别异常，回退: {e}")
+                self.tess_api = None
+        if self._pytessy is not None:
+            try:
+                text = self._pytessy.read(image.tobytes(), image.width, image.height, 1)
+                return text or ''
+            except Exception as e:
+                print(f"[DEBUG] pytessy识别异常，回退pytesseract: {e}")
+                self._pytessy = None
+        return self.pytesseract.image_to_string(image, lang=OCR_LANG, config=OCR_CONFIG)
+
+    def _shutdown_ocr_backend(self):
+        """释放常驻OCR实例（窗口关闭时调用）"""
+        if self.tess_api is not None:
+            try:
+                self.tess_api.End()
+            except Exception:
+                pass
+            self.tess_api = None
+
     def setup_matplotlib_font(self):
         """设置matplotlib中文字体"""
         try:
             import matplotlib.pyplot as plt
-            import matplotlib.font_manager as fm
-            
+
             # 尝试设置中文字体
             chinese_fonts = [
                 'Microsoft YaHei',      # 微软雅黑
@@ -178,8 +466,8 @@ class ScreenOCROrMonitor:
                 'DejaVu Sans',          # DejaVu Sans
             ]
             
-            # 检查可用的中文字体
-            available_fonts = [f.name for f in fm.fontManager.ttflist]
+            # 检查可用的中文字体（模块级缓存的set，字体表只扫描一次）
+            available_fonts = _available_font_names()
             
             selected_font = None
             for font in chinese_fonts:
@@ -296,7 +584,10 @@ class ScreenOCROrMonitor:
             chart_frame.pack(fill=tk.BOTH, expand=True)
             
             # 创建matplotlib图形
-            self.fig, self.ax = self.plt.subplots(figsize=(10, 5), dpi=100)
+            # dpi=80：交互画布不需要印刷精度，降低dpi可减小文字/标记/线宽
+            # 的像素尺寸，完整重绘（坐标轴排版+文本栅格化）明显变快；
+            # 导出图片时savefig会单独指定高dpi，不受影响
+            self.fig, self.ax = self.plt.subplots(figsize=(10, 5), dpi=80)
             self.ax.set_title("多通道实时数值监控 (支持拖动和点选)")
             self.ax.set_xlabel("时间")
             self.ax.set_ylabel("数值")
@@ -306,15 +597,36 @@ class ScreenOCROrMonitor:
             self.ax.xaxis.set_major_formatter(self.mdates.DateFormatter('%H:%M:%S'))
             self.ax.xaxis.set_major_locator(self.mdates.AutoDateLocator())
             
+            # 创建持久化图表元素（blitting用，避免每帧clear+重绘）
+            self._chart_artists = {}  # {channel_index: {'line': Line2D}}
+            self._selection_marker, = self.ax.plot([], [], linestyle='none', marker='o',
+                                                   markersize=10, markerfacecolor='gold',
+                                                   markeredgecolor='red', markeredgewidth=2,
+                                                   zorder=6)
+            self._selection_marker.set_animated(True)
+            self._placeholder_text = self.ax.text(0.5, 0.5, '暂无数据或所有通道已隐藏',
+                                                  transform=self.ax.transAxes,
+                                                  ha='center', va='center', fontsize=12)
+            self._chart_legend = None
+            self._chart_bg = None  # blit背景缓存
+            self._saving_chart = False  # savefig期间屏蔽draw_event回调
+            self._chart_layout = None  # 通道结构快照，变化时触发完整重绘
+
             # 嵌入画布
             self.canvas = self.FigureCanvasTkAgg(self.fig, chart_frame)
             self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
+
+            # 窗口尺寸变化时背景缓存失效，下次渲染走完整重绘
+            self.canvas.get_tk_widget().bind('<Configure>', self._on_canvas_resize)
+
             # 连接事件
             self.canvas.mpl_connect('button_press_event', self.on_click)
             self.canvas.mpl_connect('motion_notify_event', self.on_motion)
             self.canvas.mpl_connect('button_release_event', self.on_release)
             self.canvas.mpl_connect('scroll_event', self.on_scroll)
+            # 每次完整重绘后自动重建blit背景并补画animated元素，
+            # 交互路径因此可以用draw_idle合并高频重绘请求
+            self.canvas.mpl_connect('draw_event', self._on_draw)
         
         # 数据显示和保存框架
         data_frame = ttk.LabelFrame(main_frame, text="实时数据与导出", padding=10)
@@ -331,8 +643,9 @@ class ScreenOCROrMonitor:
         self.selection_info_frame = ttk.Frame(data_frame)
         self.selection_info_frame.pack(fill=tk.X, pady=(0, 10))
         
-        self.no_selection_label = ttk.Label(self.selection_info_frame, text="未选中任何数据点")
-        self.no_selection_label.pack(anchor=tk.W)
+        # 选中点信息只用这一个常驻Label，刷新时就地改文字
+        self.selection_label = ttk.Label(self.selection_info_frame, text="未选中任何数据点")
+        self.selection_label.pack(anchor=tk.W)
         
         # 保存按钮
         save_frame = ttk.Frame(data_frame)
@@ -344,8 +657,9 @@ class ScreenOCROrMonitor:
         self.save_csv_btn = ttk.Button(save_frame, text="导出CSV", command=self.save_csv)
         self.save_csv_btn.pack(side=tk.RIGHT, padx=(10, 0))
         
-        # 启动队列处理
+        # 启动队列处理和渲染调度
         self.process_queue()
+        self._render_tick()
     
     def add_channel(self):
         """添加新的监控通道"""
@@ -381,20 +695,14 @@ class ScreenOCROrMonitor:
                                                      outline='yellow', width=3, fill='')
         
         def on_mouse_move(event):
-            nonlocal rect_id, selection_border
             if rect_id:
-                canvas.delete(rect_id)
-                canvas.delete(selection_border)
-                
-                # 重新绘制选择矩形
-                rect_id = canvas.create_rectangle(start_x, start_y, event.x, event.y, 
-                                                outline='red', width=3, fill='blue', stipple='gray50')
-                
+                # 只更新现有矩形的坐标，避免每次鼠标移动都delete+重建canvas对象
+                canvas.coords(rect_id, start_x, start_y, event.x, event.y)
+
                 # 更新选中效果边框
                 x1, y1 = min(start_x, event.x), min(start_y, event.y)
                 x2, y2 = max(start_x, event.x), max(start_y, event.y)
-                selection_border = canvas.create_rectangle(x1-3, y1-3, x2+3, y2+3,
-                                                         outline='yellow', width=3, fill='')
+                canvas.coords(selection_border, x1-3, y1-3, x2+3, y2+3)
         
         def on_mouse_up(event):
             nonlocal end_x, end_y
@@ -411,12 +719,24 @@ class ScreenOCROrMonitor:
                 channel_name = f"通道 {channel_index + 1}"
                 channel_data = {
                     'name': channel_name,
-                    'rect': (x1, y1, x2, y2),
-                    'times': [],
-                    'values': [],
+                    # 抓屏用物理像素坐标（仅DPI感知失败时需要缩放）
+                    'rect': (int(x1 * self._sx), int(y1 * self._sy),
+                             int(x2 * self._sx), int(y2 * self._sy)),
+                    # 预分配NumPy环形缓冲（SoA布局）：O(1)追加无重分配，
+                    # 渲染端零拷贝切片直接交给matplotlib
+                    't_buf': self.np.empty(self.max_points, dtype='datetime64[ms]'),
+                    'x_buf': self.np.empty(self.max_points, dtype=self.np.float64),
+                    'v_buf': self.np.empty(self.max_points, dtype=self.np.float32),
+                    'head': 0,  # 下一个写入位置
+                    'n': 0,     # 有效数据点数
+                    'vmin': float('inf'),   # 缓冲内数值的增量极值，
+                    'vmax': float('-inf'),  # 追加时更新，极值被覆盖时才重算
+                    'last_sig': None,   # 上一tick预处理图像的哈希
+                    'last_value': None,  # 上一tick的解析值（画面未变时复用）
+                    'glyph_lut': {},    # 字形位图→字符映射，由成功的OCR结果在线学习
+
                     'color': self.get_channel_color(channel_index),
                     'visible': True,
-                    'scatter': None,  # 用于存储散点对象引用
                     'region_window': region_window,  # 存储窗口引用
                     'selection_border': selection_border  # 存储边框引用
                 }
@@ -447,6 +767,7 @@ class ScreenOCROrMonitor:
                 info_label.pack(side=tk.LEFT)
                 
                 # 更新界面
+                self._update_hull_rect()
                 self.update_channels_display()
                 self.update_channel_combo()
                 self.start_btn.config(state=tk.NORMAL)
@@ -576,10 +897,29 @@ class ScreenOCROrMonitor:
                 self.active_channel_index = 0
                 self.start_btn.config(state=tk.DISABLED)
             
+            self._update_hull_rect()
             self.update_channels_display()
             self.update_channel_combo()
             self.update_chart()
-    
+
+    def _update_hull_rect(self):
+        """重建通道区域坐标数组并重算外接矩形
+
+        rect集中存进一块连续的int32数组（通道增删时才重建），
+        monitor_loop每tick直接顺序读取；外接矩形用向量化min/max求得，
+        多通道时每tick只抓取这一个矩形再按通道裁剪。
+        """
+        if not self.channels:
+            self._rects_arr = None
+            self._hull_rect = None
+            return
+        np = self.np
+        self._rects_arr = np.array([channel['rect'] for channel in self.channels],
+                                   dtype=np.int32)
+        mins = self._rects_arr[:, :2].min(axis=0)
+        maxs = self._rects_arr[:, 2:].max(axis=0)
+        self._hull_rect = (int(mins[0]), int(mins[1]), int(maxs[0]), int(maxs[1]))
+
     def on_channel_change(self, event):
         """通道选择改变事件"""
         if self.channels:
@@ -592,11 +932,19 @@ class ScreenOCROrMonitor:
             self.update_chart()
     
     def update_channels_display(self):
-        """更新通道信息显示"""
-        # 清空现有显示
+        """更新通道信息显示
+
+        每个通道的行控件只创建一次缓存在channel['_row_widgets']里，
+        之后的刷新只config()改文字和颜色；Tk创建控件要走Tcl命令，
+        整表销毁重建在通道多、刷新频繁时开销明显。
+        """
+        # 清理已删除通道遗留的行（以及空状态提示）
+        valid_frames = {channel['_row_widgets']['frame'] for channel in self.channels
+                        if '_row_widgets' in channel}
         for widget in self.channels_frame.winfo_children():
-            widget.destroy()
-        
+            if widget not in valid_frames:
+                widget.destroy()
+
         if not self.channels:
             self.no_channels_label = ttk.Label(self.channels_frame, text="暂无监控通道，请点击'添加监控区域'创建通道")
             self.no_channels_label.pack(anchor=tk.W)
@@ -604,45 +952,68 @@ class ScreenOCROrMonitor:
             self.show_regions_btn.config(state=tk.DISABLED)
             self.hide_regions_btn.config(state=tk.DISABLED)
             return
-        
+
         self.remove_channel_btn.config(state=tk.NORMAL)
         self.show_regions_btn.config(state=tk.NORMAL)
         self.hide_regions_btn.config(state=tk.NORMAL)
-        
-        # 显示所有通道信息
+
         for i, channel in enumerate(self.channels):
-            channel_frame = ttk.Frame(self.channels_frame)
-            channel_frame.pack(fill=tk.X, pady=2)
-            
-            # 通道名称和区域信息
-            rect = channel['rect']
-            data_count = len(channel['values'])
-            latest_value = channel['values'][-1] if channel['values'] else '无数据'
-            region_status = "显示中" if channel.get('region_window') else "隐藏"
-            info_text = f"{channel['name']}: 区域({rect[0]}, {rect[1]}) - ({rect[2]}, {rect[3]}) | 数据点: {data_count} | 最新值: {latest_value} | 区域: {region_status}"
-            
-            channel_label = ttk.Label(channel_frame, text=info_text, 
-                                    foreground=channel['color'] if i == self.active_channel_index else 'black')
-            channel_label.pack(side=tk.LEFT)
-            
-            # 区域显示控制
-            region_frame = ttk.Frame(channel_frame)
-            region_frame.pack(side=tk.RIGHT)
-            
-            if channel.get('region_window'):
-                hide_btn = ttk.Button(region_frame, text="隐藏区域", 
-                                    command=lambda idx=i: self.close_region_window(idx))
-                hide_btn.pack(side=tk.RIGHT, padx=(5, 0))
-            else:
-                show_btn = ttk.Button(region_frame, text="显示区域", 
-                                    command=lambda idx=i: self.create_region_display_window(idx))
-                show_btn.pack(side=tk.RIGHT, padx=(5, 0))
-            
-            # 可见性控制
-            visible_var = tk.BooleanVar(value=channel['visible'])
-            visible_cb = ttk.Checkbutton(region_frame, text="显示曲线", variable=visible_var,
-                                       command=lambda idx=i, var=visible_var: self.toggle_channel_visibility(idx, var))
-            visible_cb.pack(side=tk.RIGHT, padx=(10, 5))
+            if '_row_widgets' not in channel:
+                self._create_channel_row(channel)
+            self.refresh_channel_row(i)
+
+    def _create_channel_row(self, channel):
+        """为通道创建一行显示控件并缓存"""
+        channel_frame = ttk.Frame(self.channels_frame)
+        channel_frame.pack(fill=tk.X, pady=2)
+
+        channel_label = ttk.Label(channel_frame)
+        channel_label.pack(side=tk.LEFT)
+
+        # 区域显示控制
+        region_frame = ttk.Frame(channel_frame)
+        region_frame.pack(side=tk.RIGHT)
+
+        region_btn = ttk.Button(region_frame)
+        region_btn.pack(side=tk.RIGHT, padx=(5, 0))
+
+        # 可见性控制
+        visible_var = tk.BooleanVar(value=channel['visible'])
+        visible_cb = ttk.Checkbutton(region_frame, text="显示曲线", variable=visible_var)
+        visible_cb.pack(side=tk.RIGHT, padx=(10, 5))
+
+        channel['_row_widgets'] = {
+            'frame': channel_frame,
+            'label': channel_label,
+            'region_btn': region_btn,
+            'visible_var': visible_var,
+            'visible_cb': visible_cb,
+        }
+
+    def refresh_channel_row(self, i):
+        """只刷新单行的文字、颜色和回调，不动控件树"""
+        channel = self.channels[i]
+        widgets = channel['_row_widgets']
+
+        rect = channel['rect']
+        data_count = channel['n']
+        latest_value = f"{self._channel_last_value(channel):.2f}" if channel['n'] else '无数据'
+        region_status = "显示中" if channel.get('region_window') else "隐藏"
+        info_text = f"{channel['name']}: 区域({rect[0]}, {rect[1]}) - ({rect[2]}, {rect[3]}) | 数据点: {data_count} | 最新值: {latest_value} | 区域: {region_status}"
+        widgets['label'].config(text=info_text,
+                                foreground=channel['color'] if i == self.active_channel_index else 'black')
+
+        # 通道删除后索引会变，回调里的idx每次刷新都重新绑定
+        if channel.get('region_window'):
+            widgets['region_btn'].config(text="隐藏区域",
+                                         command=lambda idx=i: self.close_region_window(idx))
+        else:
+            widgets['region_btn'].config(text="显示区域",
+                                         command=lambda idx=i: self.create_region_display_window(idx))
+
+        visible_var = widgets['visible_var']
+        visible_var.set(channel['visible'])
+        widgets['visible_cb'].config(command=lambda idx=i, var=visible_var: self.toggle_channel_visibility(idx, var))
     
     def update_channel_combo(self):
         """更新通道选择下拉框"""
@@ -678,6 +1049,7 @@ class ScreenOCROrMonitor:
             return
             
         self.monitoring = True
+        self._start_ocr_executor()
         self.start_btn.config(text="停止监控")
         self.add_channel_btn.config(state=tk.DISABLED)
         self.remove_channel_btn.config(state=tk.DISABLED)
@@ -689,9 +1061,76 @@ class ScreenOCROrMonitor:
         self.monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         self.monitor_thread.start()
     
+    def _start_ocr_executor(self):
+        """创建OCR并行执行器（多通道时使用）
+
+        tesserocr可用时用ThreadPoolExecutor配每工作线程一个常驻API：
+        识别核心是原生代码且运行期间释放GIL，线程池就能拿到接近线性
+        的多核加速，还省掉进程池来回pickle图像的开销。tesserocr不可用
+        时回退ProcessPoolExecutor绕过GIL。单通道或创建失败保持None，
+        monitor_loop串行识别。
+        """
+        self._ocr_executor = None
+        self._ocr_pool_kind = None
+        self._tess_api_pool = None
+        if len(self.channels) < 2:
+            return
+
+        workers = min(len(self.channels), os.cpu_count() or 1)
+
+        if self.tess_api is not None:
+            try:
+                from tesserocr import PyTessBaseAPI, PSM
+                api_pool = queue.Queue()
+                for _ in range(workers):
+                    api = PyTessBaseAPI(lang=OCR_LANG, psm=PSM.SINGLE_LINE)
+                    api.SetVariable('tessedit_char_whitelist', OCR_WHITELIST)
+                    api_pool.put(api)
+                self._tess_api_pool = api_pool
+                self._ocr_executor = ThreadPoolExecutor(max_workers=workers)
+                self._ocr_pool_kind = 'thread'
+                print(f"[DEBUG] OCR线程池已启动: {workers}个工作线程(常驻API)")
+                return
+            except Exception as e:
+                print(f"[DEBUG] OCR线程池创建失败: {e}")
+                self._tess_api_pool = None
+
+        try:
+            self._ocr_executor = ProcessPoolExecutor(max_workers=workers)
+            self._ocr_pool_kind = 'process'
+            print(f"[DEBUG] OCR进程池已启动: {workers}个工作进程")
+        except Exception as e:
+            print(f"[DEBUG] OCR进程池创建失败，使用线程内识别: {e}")
+
+    def _ocr_with_pooled_api(self, image):
+        """从常驻API池取实例执行识别（在线程池工作线程中运行）"""
+        api = self._tess_api_pool.get()
+        try:
+            api.SetImage(image)
+            return api.GetUTF8Text() or ''
+        finally:
+            self._tess_api_pool.put(api)
+
+    def _stop_ocr_executor(self):
+        """关闭OCR执行器并释放池中的常驻API"""
+        executor = getattr(self, '_ocr_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._ocr_executor = None
+        api_pool = getattr(self, '_tess_api_pool', None)
+        if api_pool is not None:
+            while not api_pool.empty():
+                try:
+                    api_pool.get_nowait().End()
+                except Exception:
+                    break
+            self._tess_api_pool = None
+        self._ocr_pool_kind = None
+
     def stop_monitoring(self):
         """停止监控"""
         self.monitoring = False
+        self._stop_ocr_executor()
         self.start_btn.config(text="开始监控")
         self.add_channel_btn.config(state=tk.NORMAL)
         if self.channels:
@@ -701,168 +1140,521 @@ class ScreenOCROrMonitor:
         self.status_label.config(text="状态: 已停止")
     
     def monitor_loop(self):
-        """监控主循环 - 多通道版本"""
+        """监控主循环 - 多通道版本
+
+        使用monotonic时钟对齐采样节拍：睡眠时长按下一拍的剩余时间计算，
+        OCR耗时不会累积成墙钟漂移。
+        """
+        next_tick = time.monotonic()
         while self.monitoring:
             try:
                 if self.channels:
                     timestamp = datetime.now()
-                    
-                    # 遍历所有通道进行截图和OCR
-                    for i, channel in enumerate(self.channels):
-                        rect = channel['rect']
-                        screenshot = ImageGrab.grab(bbox=rect)
-                        text = self.pytesseract.image_to_string(screenshot, lang='chi_sim+eng')
+
+                    # 截图：多通道时只抓取一次外接矩形，再按通道裁剪，
+                    # 把N次GDI捕获合并成1次
+                    screenshots = []
+                    hull = self._hull_rect
+                    rects = self._rects_arr
+                    if hull is not None and len(self.channels) > 1:
+                        hx, hy = hull[0], hull[1]
+                        frame = self._grab_region(hull)
+                        for i in range(len(rects)):
+                            x1, y1, x2, y2 = rects[i]
+                            roi = frame.crop((int(x1) - hx, int(y1) - hy,
+                                              int(x2) - hx, int(y2) - hy))
+                            screenshots.append((i, self._preprocess_image(roi)))
+                    else:
+                        for i, channel in enumerate(self.channels):
+                            rect = channel['rect']
+                            screenshots.append((i, self._preprocess_image(self._grab_region(rect))))
+
+                    # 画面指纹比对：二值化后的区域与上一tick完全相同时
+                    # 跳过OCR，直接复用上次的解析结果（稳态仪表大部分
+                    # tick都能命中）
+                    batch = []
+                    to_ocr = []
+                    fast_results = []
+                    for i, img in screenshots:
+                        channel = self.channels[i]
+                        sig = hash(img.tobytes())
+                        if sig == channel['last_sig']:
+                            if channel['last_value'] is not None:
+                                batch.append((i, timestamp, channel['last_value']))
+                                if DEBUG:
+                                    print(f"[DEBUG] 通道{i}画面未变化，复用: {channel['last_value']:.2f}")
+                            continue
+                        channel['last_sig'] = sig
+
+                        # 固定字体快速路径：字形模板全部命中时免去Tesseract
+                        fast_text = self._match_digit_templates(channel, img)
+                        if fast_text is not None:
+                            fast_results.append((i, fast_text))
+                            if DEBUG:
+                                print(f"[DEBUG] 通道{i}模板匹配: '{fast_text}'")
+                            continue
+
+                        to_ocr.append((i, img))
+
+                    # OCR识别：有执行器时并行提交，否则线程内顺序识别
+                    executor = self._ocr_executor
+                    if not to_ocr:
+                        results = []
+                    elif executor is not None and self._ocr_pool_kind == 'thread':
+                        # 线程池+常驻API：原生识别核心释放GIL，近线性加速
+                        indices = [i for i, _ in to_ocr]
+                        texts = executor.map(self._ocr_with_pooled_api,
+                                             [img for _, img in to_ocr])
+                        results = list(zip(indices, texts))
+                    elif executor is not None:
+                        tesseract_cmd = self.pytesseract.pytesseract.tesseract_cmd
+                        futures = [(i, executor.submit(_ocr_region_worker, img.tobytes(),
+                                                       img.size, img.mode, tesseract_cmd))
+                                   for i, img in to_ocr]
+                        results = [(i, future.result()) for i, future in futures]
+                    else:
+                        results = [(i, self._ocr_image(img)) for i, img in to_ocr]
+
+                    # 解析结果先攒在局部列表，最后一次加锁批量入队；
+                    # Tesseract识别成功的同时在线学习字形模板
+                    ocr_imgs = dict(to_ocr)
+                    for i, text in fast_results + results:
                         value = self.parse_value(text)
-                        
-                        # 只有成功解析到有效数值才放入队列
+
+                        # 只保留成功解析的有效数值
                         if value is not None and value >= 0:
-                            # 线程安全地放入队列
-                            try:
-                                self.data_queue.put((i, timestamp, value), block=False)
+                            self.channels[i]['last_value'] = value
+                            batch.append((i, timestamp, value))
+                            img = ocr_imgs.get(i)
+                            if img is not None:
+                                self._learn_digit_templates(self.channels[i], img, text)
+                            if DEBUG:
                                 print(f"[DEBUG] 通道{i}解析成功: {value:.2f} at {timestamp.strftime('%H:%M:%S')}")
-                            except queue.Full:
-                                print(f"[DEBUG] 队列已满，丢弃数据: 通道{i} - {value:.2f}")
                         else:
-                            print(f"[DEBUG] 通道{i}解析失败或无效值: {text.strip()}")
-                
-                time.sleep(self.interval)
+                            self.channels[i]['last_value'] = None
+                            if DEBUG:
+                                print(f"[DEBUG] 通道{i}解析失败或无效值: {text.strip()}")
+
+                    if batch:
+                        with self._data_lock:
+                            self.data_queue.extend(batch)
+                        self._schedule_drain()
+
+                next_tick += self.interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # 单拍耗时超过间隔，重新对齐，不追赶积压的节拍
+                    next_tick = time.monotonic()
             except Exception as e:
                 print(f"[DEBUG] 监控错误: {e}")
                 time.sleep(1)
+                next_tick = time.monotonic()
+
+        # 监控结束，释放本线程的mss捕获句柄
+        sct = getattr(self._sct_local, 'sct', None)
+        if sct is not None:
+            try:
+                sct.close()
+            except Exception:
+                pass
+            self._sct_local.sct = None
     
+    def _match_digit_templates(self, channel, image):
+        """固定字体快速路径：用已学习的字形模板直接拼出识别文本
+
+        全部字形都命中模板时返回文本（纯NumPy，亚毫秒级）；出现未知
+        字形返回None，回退Tesseract。模板由成功的Tesseract识别在线
+        学习，无需预置字库。
+        """
+        lut = channel['glyph_lut']
+        if not lut:
+            return None
+        glyphs = _segment_glyphs(image, self.np)
+        if not glyphs:
+            return None
+        chars = []
+        for glyph in glyphs:
+            char = lut.get(_glyph_key(glyph))
+            if char is None:
+                return None
+            chars.append(char)
+        return ''.join(chars)
+
+    def _learn_digit_templates(self, channel, image, text):
+        """从一次成功的Tesseract识别中学习字形→字符映射"""
+        chars = [c for c in text.strip() if c in OCR_WHITELIST]
+        if not chars:
+            return
+        glyphs = _segment_glyphs(image, self.np)
+        if not glyphs or len(glyphs) != len(chars):
+            # 分段数与字符数对不上（粘连/噪点），放弃本次学习
+            return
+        lut = channel['glyph_lut']
+        for glyph, char in zip(glyphs, chars):
+            lut[_glyph_key(glyph)] = char
+        # 字形表异常膨胀说明分段不稳定，整表丢弃重学
+        if len(lut) > 64:
+            lut.clear()
+
+    def _grab_region(self, rect):
+        """抓取屏幕区域
+
+        优先使用mss：常驻捕获句柄+复用像素缓冲，省掉ImageGrab每次
+        重开GDI/DC和整帧BGRX拷贝的开销。实例按调用线程惰性创建并
+        复用（mss实例不是线程安全的），不可用时回退ImageGrab。
+        """
+        sct = self._get_sct()
+        if sct is not None:
+            try:
+                x1, y1, x2, y2 = rect
+                shot = sct.grab({'left': x1, 'top': y1,
+                                 'width': x2 - x1, 'height': y2 - y1})
+                return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+            except Exception as e:
+                print(f"[DEBUG] mss抓屏异常，回退ImageGrab: {e}")
+                self._sct_failed = True
+        return ImageGrab.grab(bbox=rect)
+
+    def _get_sct(self):
+        """取当前线程的mss实例，不可用时返回None"""
+        if self._sct_failed:
+            return None
+        sct = getattr(self._sct_local, 'sct', None)
+        if sct is None:
+            try:
+                import mss
+                sct = mss.mss()
+                self._sct_local.sct = sct
+                print("[DEBUG] 抓屏后端: mss")
+            except Exception:
+                self._sct_failed = True
+                return None
+        return sct
+
+    def _preprocess_image(self, image):
+        """OCR前预处理：转灰度并在区域过大时等比降采样
+
+        RGB转灰度把送进Tesseract的数据量减为1/3；数字区域高度超过
+        约64px后对识别率已无增益，继续放大只会拖慢识别。
+        """
+        try:
+            image = image.convert('L')
+
+            if image.height > OCR_MAX_HEIGHT:
+                # 超过2倍先用整数因子box缩小（reduce比Lanczos便宜得多），
+                # 剩余的非整数部分再用Lanczos精缩
+                factor = image.height // OCR_MAX_HEIGHT
+                if factor >= 2:
+                    image = image.reduce(factor)
+                if image.height > OCR_MAX_HEIGHT:
+                    ratio = OCR_MAX_HEIGHT / image.height
+                    new_size = (max(1, int(image.width * ratio)), OCR_MAX_HEIGHT)
+                    image = image.resize(new_size, Image.LANCZOS)
+            elif 0 < image.height < OCR_MIN_HEIGHT:
+                # 小字号区域先放大再识别
+                ratio = OCR_MIN_HEIGHT / image.height
+                new_size = (max(1, int(image.width * ratio)), OCR_MIN_HEIGHT)
+                image = image.resize(new_size, Image.LANCZOS)
+
+            # 二值化：Otsu自适应阈值+point()查找表，整个转换在PIL的
+            # C循环里一次遍历完成。干净的黑白输入能跳过Tesseract内部
+            # 的Leptonica预处理，LSTM收敛也更快
+            threshold = _otsu_threshold(image.histogram())
+            image = image.point(_binarize_lut(threshold))
+
+            return image
+        except Exception as e:
+            print(f"[DEBUG] 图像预处理异常: {e}")
+            return image
+
     def parse_value(self, text):
         """解析数值"""
         try:
             # 清理文本，移除多余字符
             cleaned_text = text.strip()
-            print(f"[DEBUG] OCR原始文本: '{cleaned_text}'")
-            
-            patterns = [
-                r'计数率[：:]\s*(\d+\.?\d*)\s*cps',
-                r'(\d+\.?\d*)\s*cps',
-                r'计数率[：:]\s*(\d+\.?\d*)',
-                r'Rate[：:]\s*(\d+\.?\d*)',
-                r'数值[：:]\s*(\d+\.?\d*)',
-                # 添加更多模式
-                r'(\d{1,6}\.?\d{0,2})',  # 匹配1-6位整数加可选小数部分
-                r'\b(\d+\.?\d*)\b',  # 匹配独立的数字
-            ]
-            
-            for i, pattern in enumerate(patterns):
-                match = re.search(pattern, cleaned_text, re.IGNORECASE)
-                if match:
-                    value_str = match.group(1)
-                    value = float(value_str)
-                    print(f"[DEBUG] 模式{i+1}匹配成功: {value_str} -> {value}")
-                    
-                    # 检查数值合理性（0-100000的范围比较合理）
-                    if 0 <= value <= 100000:
-                        return value
-                    else:
-                        print(f"[DEBUG] 数值超出合理范围: {value}")
-                        continue
+            if DEBUG:
+                print(f"[DEBUG] OCR原始文本: '{cleaned_text}'")
             
-            print(f"[DEBUG] 所有模式都未匹配到有效数值")
+            # 解析核心是带lru_cache的纯函数，重复文本直接命中缓存
+            best_priority, best_value = _parse_text_value(cleaned_text)
+
+            if best_value is not None:
+                if DEBUG:
+                    print(f"[DEBUG] 模式{best_priority}匹配成功: {best_value}")
+                return best_value
+
+            if DEBUG:
+                print(f"[DEBUG] 所有模式都未匹配到有效数值")
             return None
         except Exception as e:
             print(f"[DEBUG] 数值解析异常: {e}")
             return None
     
+    def _schedule_drain(self):
+        """OCR线程产出数据后通知主线程尽快清队
+
+        after_idle把process_queue插到Tk事件循环的空闲队列里，
+        数据到达即处理，不用等轮询周期；标志位保证同一时刻
+        只挂一个待执行的清队调用。
+        """
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        try:
+            self.root.after_idle(self.process_queue)
+        except Exception:
+            self._drain_scheduled = False
+
     def process_queue(self):
         """处理数据队列 - 多通道版本"""
         # 确保在主线程中执行UI更新
         if threading.current_thread() != threading.main_thread():
             return
-            
+
+        self._drain_scheduled = False
         try:
             new_data_added = False
+
+            # 一次加锁换出整批数据，再在无锁状态下写入通道环形缓冲
+            if self.data_queue:
+                with self._data_lock:
+                    items = list(self.data_queue)
+                    self.data_queue.clear()
+            else:
+                items = []
+
+            # 先按通道分桶，再整块写入环形缓冲：每通道一次向量化
+            # 转换+最多两段切片赋值，替代逐采样的Python写入
+            # 循环内只有局部变量访问（LOAD_FAST），属性/方法链和
+            # 标志位写入都挪到循环外
+            nchan = len(self.channels)
+            per_ch_t = [[] for _ in range(nchan)]
+            per_ch_v = [[] for _ in range(nchan)]
+            for channel_index, timestamp, value in items:
+                # 确保通道索引有效，且只添加有效的数据点
+                if 0 <= channel_index < nchan and value is not None and value >= 0:
+                    per_ch_t[channel_index].append(timestamp)
+                    per_ch_v[channel_index].append(value)
+
+            append_block = self._append_block
+            for i in range(nchan):
+                if per_ch_t[i]:
+                    append_block(i, per_ch_t[i], per_ch_v[i])
+                    new_data_added = True
             
-            # 批量处理队列中的所有数据
-            while True:
-                try:
-                    channel_index, timestamp, value = self.data_queue.get_nowait()
-                    
-                    # 确保通道索引有效
-                    if 0 <= channel_index < len(self.channels):
-                        # 只添加有效的数据点
-                        if value is not None and value >= 0:
-                            self.channels[channel_index]['times'].append(timestamp)
-                            self.channels[channel_index]['values'].append(value)
-                            new_data_added = True
-                            
-                            # 限制数据点数量
-                            if len(self.channels[channel_index]['times']) > self.max_points:
-                                excess = len(self.channels[channel_index]['times']) - self.max_points
-                                self.channels[channel_index]['times'] = self.channels[channel_index]['times'][excess:]
-                                self.channels[channel_index]['values'] = self.channels[channel_index]['values'][excess:]
-                    
-                except queue.Empty:
-                    break
-            
-            # 如果有新数据添加，更新显示
+            # 如果有新数据添加，更新显示；图表只标脏，由渲染调度器按节奏重绘
             if new_data_added:
                 self.update_current_values_display()
                 self.update_channels_display()
-                self.update_chart()
+                self._chart_dirty = True
                 
         except Exception as e:
             print(f"[DEBUG] 队列处理异常: {e}")
-            import traceback
             traceback.print_exc()
         
-        # 安全地重新调度
+        # 数据到达时由_schedule_drain即时唤醒，这里只保留500ms看门狗
+        # 兜底；复用单个定时器句柄，防止事件触发的调用把定时器链翻倍
         try:
             if hasattr(self, 'root') and self.root.winfo_exists():
-                self.root.after(100, self.process_queue)
+                if self._drain_timer is not None:
+                    self.root.after_cancel(self._drain_timer)
+                self._drain_timer = self.root.after(500, self.process_queue)
         except:
             pass
     
+    def _window_hidden(self):
+        """窗口是否处于最小化/不可见状态（此时渲染纯属浪费CPU）"""
+        try:
+            if self.root.state() == 'iconic':
+                return True
+            if hasattr(self, 'canvas'):
+                return not self.canvas.get_tk_widget().winfo_viewable()
+            return False
+        except Exception:
+            return False
+
+    def _append_block(self, channel_index, timestamps, values):
+        """把同一通道的一批采样整块写入环形缓冲
+
+        满时head绕回覆盖最老点；datetime64和日期数值的转换对整批
+        一次完成，写入用最多两段切片赋值（绕回时拆两段），
+        渲染端只做追加式读取。
+        """
+        np = self.np
+        channel = self.channels[channel_index]
+        k = len(values)
+        if k >= self.max_points:
+            # 单批超过缓冲容量时只保留最新的max_points个
+            timestamps = timestamps[-self.max_points:]
+            values = values[-self.max_points:]
+            k = self.max_points
+
+        t_arr = np.array(timestamps, dtype='datetime64[ms]')
+        x_arr = self.mdates.date2num(timestamps)
+        v_arr = np.asarray(values, dtype=np.float32)
+
+        head = channel['head']
+        first = min(k, self.max_points - head)
+        rest = k - first
+
+        # 覆盖旧点前先看被覆盖的槽位里有没有当前极值，有才需要重算。
+        # 增量检查只在缓冲已满时可靠（此时所有槽位都有效）；从未满
+        # 转满的那一拍，被覆盖范围混着np.empty的未初始化内存，直接
+        # 无条件重算一次
+        recompute_extrema = False
+        if channel['n'] + k > self.max_points:
+            if channel['n'] < self.max_points:
+                recompute_extrema = True
+            else:
+                old = channel['v_buf'][head:head + first]
+                if rest:
+                    old = np.concatenate((old, channel['v_buf'][:rest]))
+                if old.min() <= channel['vmin'] or old.max() >= channel['vmax']:
+                    recompute_extrema = True
+
+        channel['t_buf'][head:head + first] = t_arr[:first]
+        channel['x_buf'][head:head + first] = x_arr[:first]
+        channel['v_buf'][head:head + first] = v_arr[:first]
+        if rest:
+            channel['t_buf'][:rest] = t_arr[first:]
+            channel['x_buf'][:rest] = x_arr[first:]
+            channel['v_buf'][:rest] = v_arr[first:]
+
+        channel['head'] = (head + k) % self.max_points
+        channel['n'] = min(channel['n'] + k, self.max_points)
+
+        # 维护增量极值：正常追加只和批内极值比较，O(1)；
+        # 只有极值点被覆盖时才对整个缓冲重算（此时缓冲必然已满）
+        if recompute_extrema:
+            channel['vmin'] = float(channel['v_buf'].min())
+            channel['vmax'] = float(channel['v_buf'].max())
+        else:
+            bmin = float(v_arr.min())
+            bmax = float(v_arr.max())
+            if bmin < channel['vmin']:
+                channel['vmin'] = bmin
+            if bmax > channel['vmax']:
+                channel['vmax'] = bmax
+
+    def _channel_series(self, channel):
+        """按时间顺序返回通道的(x_buf, v_buf)数组
+
+        缓冲未绕回时是零拷贝切片；绕回后拼接两段连续内存。
+        """
+        n = channel['n']
+        head = channel['head']
+        if n < self.max_points or head == 0:
+            return channel['x_buf'][:n], channel['v_buf'][:n]
+        np = self.np
+        return (np.concatenate((channel['x_buf'][head:], channel['x_buf'][:head])),
+                np.concatenate((channel['v_buf'][head:], channel['v_buf'][:head])))
+
+    def _channel_times_arr(self, channel):
+        """按时间顺序返回通道的datetime64数组（导出用，保持向量化）"""
+        n = channel['n']
+        head = channel['head']
+        if n < self.max_points or head == 0:
+            return channel['t_buf'][:n]
+        return self.np.concatenate((channel['t_buf'][head:], channel['t_buf'][:head]))
+
+    def _channel_point(self, channel, index):
+        """取按时间顺序第index个点的(日期数值, 数值)"""
+        n = channel['n']
+        phys = (channel['head'] - n + index) % self.max_points
+        return channel['x_buf'][phys], channel['v_buf'][phys]
+
+    def _channel_time_at(self, channel, index):
+        """取按时间顺序第index个点的datetime"""
+        n = channel['n']
+        phys = (channel['head'] - n + index) % self.max_points
+        return channel['t_buf'][phys].item()
+
+    def _channel_last_value(self, channel):
+        """取通道最新数值，无数据返回None"""
+        if channel['n'] == 0:
+            return None
+        return float(channel['v_buf'][(channel['head'] - 1) % self.max_points])
+
+    def _render_tick(self):
+        """渲染调度器：按固定节奏（最高2Hz）检查脏标记并重绘图表
+
+        OCR摄取速率与图表渲染速率完全解耦：队列批量摄取只置脏标记，
+        即使数据到达更快，重绘频率也有上限。
+        """
+        try:
+            # 窗口最小化/不可见时跳过重绘；脏标记保留，恢复可见后补画
+            if self._chart_dirty and not self._window_hidden():
+                self._chart_dirty = False
+                self._update_chart_safe()
+        except Exception as e:
+            print(f"[DEBUG] 渲染调度异常: {e}")
+
+        # 安全地重新调度
+        try:
+            if hasattr(self, 'root') and self.root.winfo_exists():
+                self.root.after(500, self._render_tick)
+        except:
+            pass
+
     def update_current_values_display(self):
-        """更新当前值显示"""
-        # 清空现有显示
+        """更新当前值显示
+
+        每通道的数值Label只创建一次，之后刷新只configure文字；
+        数值没变时连configure都省掉。这个函数每次摄取都会被调，
+        整排销毁重建Tk控件的开销远大于改一次text。
+        """
+        # 清理已删除通道遗留的Label（以及空状态提示）
+        valid_labels = {channel['_value_label'] for channel in self.channels
+                        if '_value_label' in channel}
         for widget in self.current_values_frame.winfo_children():
-            widget.destroy()
-        
-        if not any(len(channel['values']) > 0 for channel in self.channels):
+            if widget not in valid_labels:
+                widget.destroy()
+
+        if not any(channel['n'] > 0 for channel in self.channels):
+            for channel in self.channels:
+                if '_value_label' in channel:
+                    del channel['_value_label']
+            for widget in self.current_values_frame.winfo_children():
+                widget.destroy()
             self.no_data_label = ttk.Label(self.current_values_frame, text="暂无数据")
             self.no_data_label.pack(anchor=tk.W)
             return
-        
+
         # 显示所有有数据的通道的当前值
-        for i, channel in enumerate(self.channels):
-            if channel['values']:
-                current_value = channel['values'][-1]
-                value_label = ttk.Label(self.current_values_frame, 
-                                      text=f"{channel['name']}: {current_value:.2f}",
-                                      font=("Arial", 10, "bold"),
-                                      foreground=channel['color'])
-                value_label.pack(side=tk.LEFT, padx=(0, 20))
+        for channel in self.channels:
+            if channel['n']:
+                current_value = self._channel_last_value(channel)
+                if '_value_label' not in channel:
+                    channel['_value_label'] = ttk.Label(self.current_values_frame,
+                                                        font=("Arial", 10, "bold"),
+                                                        foreground=channel['color'])
+                    channel['_value_label'].pack(side=tk.LEFT, padx=(0, 20))
+                    channel['_last_shown'] = None
+                if channel['_last_shown'] != current_value:
+                    channel['_last_shown'] = current_value
+                    channel['_value_label'].configure(text=f"{channel['name']}: {current_value:.2f}")
     
     def update_selection_info(self):
-        """更新选中点信息显示"""
-        # 清空现有显示
-        for widget in self.selection_info_frame.winfo_children():
-            widget.destroy()
-        
+        """更新选中点信息显示（常驻Label就地改文字，不重建控件）"""
         if not self.selected_points:
-            self.no_selection_label = ttk.Label(self.selection_info_frame, text="未选中任何数据点")
-            self.no_selection_label.pack(anchor=tk.W)
+            self.selection_label.configure(text="未选中任何数据点", foreground='black')
             return
-        
+
         # 显示选中点信息
         info_text = f"选中 {len(self.selected_points)} 个数据点: "
         for i, (channel_idx, point_idx) in enumerate(self.selected_points):
             if i < 3:  # 只显示前3个选中点
                 channel = self.channels[channel_idx]
-                time_str = channel['times'][point_idx].strftime('%H:%M:%S')
-                value = channel['values'][point_idx]
+                time_str = self._channel_time_at(channel, point_idx).strftime('%H:%M:%S')
+                value = self._channel_point(channel, point_idx)[1]
                 info_text += f"{channel['name']}[{time_str}: {value:.2f}] "
             elif i == 3:
                 info_text += "..."
                 break
-        
-        selection_label = ttk.Label(self.selection_info_frame, text=info_text, foreground='blue')
-        selection_label.pack(anchor=tk.W)
+
+        self.selection_label.configure(text=info_text, foreground='blue')
     
     def update_chart(self):
         """更新图表 - 多通道版本"""
@@ -877,79 +1669,186 @@ class ScreenOCROrMonitor:
         
         self._update_chart_safe()
     
+    def _on_canvas_resize(self, event):
+        """画布尺寸变化回调：背景缓存失效"""
+        self._chart_bg = None
+
+    def _ensure_channel_artists(self):
+        """按当前通道结构同步持久化图表元素，返回结构是否发生变化"""
+        layout = tuple((channel['name'], channel['color'], channel['visible'])
+                       for channel in self.channels)
+        changed = layout != self._chart_layout
+
+        # 稳态快速路径：结构未变时跳过下面的两趟同步循环
+        if not changed and len(self._chart_artists) == len(self.channels):
+            return False
+
+        # 删除多余的旧通道元素
+        for i in list(self._chart_artists.keys()):
+            if i >= len(self.channels):
+                self._chart_artists.pop(i)['line'].remove()
+
+        # 为新通道创建元素，为已有通道同步样式。每通道只有一条带
+        # 标记的Line2D：散点PathCollection逐点独立Path，成本约是
+        # 线上标记的两倍，点选反正走select_point的向量化搜索
+        for i, channel in enumerate(self.channels):
+            if i not in self._chart_artists:
+                line, = self.ax.plot([], [], '-', color=channel['color'],
+                                     linewidth=1.5, alpha=0.6, marker='o',
+                                     markersize=3, label=channel['name'])
+                # animated=True使canvas.draw()跳过数据元素，背景缓存保持干净
+                line.set_animated(True)
+                self._chart_artists[i] = {'line': line}
+            elif changed:
+                artists = self._chart_artists[i]
+                artists['line'].set_color(channel['color'])
+                artists['line'].set_label(channel['name'])
+
+        self._chart_layout = layout
+        return changed
+
     def _update_chart_safe(self):
-        """安全地更新图表（在主线程中执行）"""
+        """安全地更新图表（在主线程中执行）
+
+        持久化Line2D/PathCollection只在通道结构变化时重建，
+        普通数据更新走set_data + blit局部重绘，避免每帧clear+replot。
+        """
         if not hasattr(self, 'ax'):
             return
-            
+
         try:
-            self.ax.clear()
-            
+            np = self.np
+            structure_changed = self._ensure_channel_artists()
+            need_full_draw = structure_changed or self._chart_bg is None
+
             has_visible_data = False
-            
-            # 绘制所有可见通道的数据
+            all_x_min = all_x_max = None
+            all_y_min = all_y_max = None
+
+            # 更新所有通道的数据（不重建元素）
             for i, channel in enumerate(self.channels):
-                if not channel['visible'] or not channel['times'] or not channel['values']:
+                artists = self._chart_artists[i]
+                visible = bool(channel['visible'] and channel['n'] > 0)
+                artists['line'].set_visible(visible)
+                if not visible:
                     continue
-                    
+
                 has_visible_data = True
-                times = channel['times']
-                values = channel['values']
-                
-                # 绘制曲线
-                line = self.ax.plot(times, values, '-', color=channel['color'], 
-                                  linewidth=1.5, alpha=0.6, label=channel['name'])[0]
-                
-                # 绘制散点，并为每个点设置picker属性
-                scatter = self.ax.scatter(times, values, c=channel['color'], s=30, alpha=0.8, 
-                                        zorder=5, picker=True, pickradius=5)
-                
-                # 存储散点对象引用
-                channel['scatter'] = scatter
-                
-                # 高亮选中的点
-                for channel_idx, point_idx in self.selected_points:
-                    if channel_idx == i and point_idx < len(times):
-                        self.ax.scatter([times[point_idx]], [values[point_idx]], 
-                                      c='gold', s=100, alpha=1.0, zorder=6, 
-                                      edgecolors='red', linewidths=2)
-            
+                # 环形缓冲零拷贝切片（绕回时拼接一次），无逐点转换
+                xnum, values = self._channel_series(channel)
+                x_min, x_max = xnum[0], xnum[-1]
+
+                # 降采样到像素分辨率：点数超过轴宽两倍时按步长抽稀，
+                # 绘制成本以画布宽度为上限，与缓冲大小无关；坐标范围
+                # 和极值仍按完整数据计算，抽稀只影响画了哪些点
+                npix = int(self.ax.bbox.width) * 2
+                if npix > 0 and len(xnum) > npix:
+                    stride = len(xnum) // npix
+                    xnum = xnum[::stride]
+                    values = values[::stride]
+
+                artists['line'].set_data(xnum, values)
+
+                # 数值极值在摄取时增量维护，免去每帧整组min/max扫描
+                y_min, y_max = channel['vmin'], channel['vmax']
+                all_x_min = x_min if all_x_min is None else min(all_x_min, x_min)
+                all_x_max = x_max if all_x_max is None else max(all_x_max, x_max)
+                all_y_min = y_min if all_y_min is None else min(all_y_min, y_min)
+                all_y_max = y_max if all_y_max is None else max(all_y_max, y_max)
+
+            # 高亮选中的点（复用同一个标记Line2D）
+            sel_points = []
+            for channel_idx, point_idx in self.selected_points:
+                if channel_idx < len(self.channels):
+                    channel = self.channels[channel_idx]
+                    if channel['visible'] and point_idx < channel['n']:
+                        sel_points.append(self._channel_point(channel, point_idx))
+            if sel_points:
+                xs, ys = zip(*sel_points)
+                self._selection_marker.set_data(xs, ys)
+                self._selection_marker.set_visible(True)
+            else:
+                self._selection_marker.set_data([], [])
+                self._selection_marker.set_visible(False)
+
+            if self._placeholder_text.get_visible() != (not has_visible_data):
+                self._placeholder_text.set_visible(not has_visible_data)
+                need_full_draw = True
+
             if not has_visible_data:
-                self.ax.text(0.5, 0.5, '暂无数据或所有通道已隐藏', 
-                           transform=self.ax.transAxes, ha='center', va='center', fontsize=12)
-                self.ax.set_xlim(0, 1)
-                self.ax.set_ylim(0, 1)
+                new_xlim = (0, 1)
+                new_ylim = (0, 1)
             else:
-                # 设置图表样式
-                self.ax.set_title("多通道实时数值监控 (支持拖动和点选)")
-                self.ax.set_xlabel("时间")
-                self.ax.set_ylabel("数值")
-                self.ax.grid(True, alpha=0.3)
-                self.ax.legend(loc='upper right')
-                
-                # 设置时间格式化
-                self.ax.xaxis.set_major_formatter(self.mdates.DateFormatter('%H:%M:%S'))
-                self.ax.xaxis.set_major_locator(self.mdates.AutoDateLocator())
-                
-                # 自动调整Y轴范围
-                all_values = []
-                for channel in self.channels:
-                    if channel['visible'] and channel['values']:
-                        all_values.extend(channel['values'])
-                
-                if all_values:
-                    y_min, y_max = min(all_values), max(all_values)
-                    margin = (y_max - y_min) * 0.1 if y_max > y_min else 1
-                    self.ax.set_ylim(max(0, y_min - margin), y_max + margin)
-            
+                # 自动调整坐标范围
+                x_margin = (all_x_max - all_x_min) * 0.05 if all_x_max > all_x_min else 1.0 / 86400
+                y_margin = (all_y_max - all_y_min) * 0.1 if all_y_max > all_y_min else 1
+                new_xlim = (all_x_min - x_margin, all_x_max + x_margin)
+                new_ylim = (max(0, all_y_min - y_margin), all_y_max + y_margin)
+
+                # 图例只在通道结构变化时重建
+                if structure_changed or self._chart_legend is None:
+                    self._chart_legend = self.ax.legend(loc='upper right')
+                    need_full_draw = True
+
+            # 坐标范围变化时必须完整重绘（坐标轴刻度需要重新排版）
+            if new_xlim != self.ax.get_xlim() or new_ylim != self.ax.get_ylim():
+                self.ax.set_xlim(new_xlim)
+                self.ax.set_ylim(new_ylim)
+                need_full_draw = True
+
             # 安全地刷新画布
             if hasattr(self, 'canvas'):
-                self.canvas.draw()
-            
+                if need_full_draw:
+                    # 完整重绘：draw_event回调重建背景缓存并补画数据元素
+                    self.canvas.draw()
+                else:
+                    # blit路径：恢复缓存背景，只画数据元素
+                    self.canvas.restore_region(self._chart_bg)
+                    self._draw_animated_artists()
+                    self.canvas.blit(self.ax.bbox)
+
         except Exception as e:
             print(f"[DEBUG] 图表更新异常: {e}")
-            import traceback
             traceback.print_exc()
+
+    def _draw_animated_artists(self):
+        """绘制所有animated数据元素（blit前调用）"""
+        for i in range(len(self.channels)):
+            artists = self._chart_artists.get(i)
+            if artists:
+                self.ax.draw_artist(artists['line'])
+        if self._selection_marker.get_visible():
+            self.ax.draw_artist(self._selection_marker)
+
+    def _on_draw(self, event):
+        """完整重绘后的回调：重建blit背景缓存并补画animated数据元素
+
+        canvas.draw()/draw_idle()会跳过animated元素，正好留下干净的
+        背景；缓存之后立刻把数据元素画回渲染器，本帧显示保持完整。
+
+        savefig也会触发draw_event，但那是导出分辨率的渲染器，而且
+        保存时animated标记已临时取消、数据已画进背景——既不能拿它
+        当blit背景，也不能再补画一遍把半透明曲线叠深，直接跳过。
+        """
+        if self._saving_chart:
+            return
+        try:
+            self._chart_bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._draw_animated_artists()
+        except Exception as e:
+            print(f"[DEBUG] 背景缓存刷新异常: {e}")
+
+    def _redraw_canvas_full(self):
+        """请求一次完整重绘（交互缩放/拖动后调用）
+
+        draw_idle把请求合并到Tk事件循环的下一次空转：60Hz的拖动/
+        滚轮事件流只产生渲染吞吐允许的重绘次数，不再每个事件同步
+        阻塞一次完整draw；背景缓存由draw_event回调自动刷新。
+        """
+        if not hasattr(self, 'canvas'):
+            return
+        self._chart_bg = None
+        self.canvas.draw_idle()
     
     # 图表交互功能
     def on_click(self, event):
@@ -967,7 +1866,9 @@ class ScreenOCROrMonitor:
                 self.original_ylim = self.ax.get_ylim()
         
         elif event.button == 3:  # 右键
-            # 右键取消选择
+            # 右键取消选择；本来就没有选中点时直接返回，省一次重绘
+            if not self.selected_points:
+                return
             self.selected_points.clear()
             self.update_selection_info()
             self.update_chart()
@@ -989,7 +1890,7 @@ class ScreenOCROrMonitor:
             
             self.ax.set_xlim(new_xlim)
             self.ax.set_ylim(new_ylim)
-            self.canvas.draw()
+            self._redraw_canvas_full()
     
     def on_release(self, event):
         """鼠标释放事件处理"""
@@ -1016,37 +1917,42 @@ class ScreenOCROrMonitor:
         
         self.ax.set_xlim(new_xlim)
         self.ax.set_ylim(new_ylim)
-        self.canvas.draw()
+        self._redraw_canvas_full()
     
     def select_point(self, event):
         """选择数据点"""
         if not self.channels:
             return
-        
-        # 查找最近的数据点
+
+        np = self.np
+
+        # 按坐标轴跨度归一化的距离权重：x是日期数值、y是读数，
+        # 量纲相差多个数量级，归一化后的距离才近似屏幕上的远近
+        xlim = self.ax.get_xlim()
+        ylim = self.ax.get_ylim()
+        wx = 1.0 / (xlim[1] - xlim[0]) ** 2 if xlim[1] > xlim[0] else 0.0
+        wy = 1.0 / (ylim[1] - ylim[0]) ** 2 if ylim[1] > ylim[0] else 0.0
+
+        # 每通道一次向量化argmin，替代逐点的Python距离循环
         min_distance = float('inf')
         selected_channel = -1
         selected_point = -1
-        
+
         for i, channel in enumerate(self.channels):
-            if not channel['visible'] or not channel['times'] or not channel['values']:
+            if not channel['visible'] or channel['n'] == 0:
                 continue
-            
-            times = channel['times']
-            values = channel['values']
-            
-            for j, (t, v) in enumerate(zip(times, values)):
-                # 计算距离
-                dist = ((self.mdates.date2num(t) - event.xdata) ** 2 + 
-                       (v - event.ydata) ** 2)
-                
-                if dist < min_distance:
-                    min_distance = dist
-                    selected_channel = i
-                    selected_point = j
-        
-        # 如果找到足够近的点
-        if min_distance < 0.001:  # 距离阈值
+
+            xnum, values = self._channel_series(channel)
+            dist = (xnum - event.xdata) ** 2 * wx + (values - event.ydata) ** 2 * wy
+            j = int(dist.argmin())
+
+            if dist[j] < min_distance:
+                min_distance = float(dist[j])
+                selected_channel = i
+                selected_point = j
+
+        # 如果找到足够近的点（阈值是归一化坐标系下的距离平方）
+        if min_distance < 0.0005:
             point_key = (selected_channel, selected_point)
             
             # 如果按住Ctrl键，可以多选
@@ -1083,16 +1989,29 @@ class ScreenOCROrMonitor:
         
         self.ax.set_xlim([x_center - x_width/2, x_center + x_width/2])
         self.ax.set_ylim([y_center - y_height/2, y_center + y_height/2])
-        self.canvas.draw()
+        self._redraw_canvas_full()
     
     def reset_view(self):
         """重置视图到自动范围"""
         self.ax.relim()
         self.ax.autoscale_view()
-        self.canvas.draw()
+        self._redraw_canvas_full()
     
+    def _refresh_all(self):
+        """数据批量变动后的整体刷新：各面板各刷一遍，图表只重绘一次
+
+        各面板刷新都是就地configure，开销很小；图表重绘集中到最后
+        一次update_chart，避免一个用户操作触发多轮matplotlib渲染。
+        """
+        self.update_current_values_display()
+        self.update_selection_info()
+        self.update_channels_display()
+        self.update_chart()
+
     def clear_selection(self):
-        """清除所有选中的点"""
+        """清除所有选中的点（已是空选择时不触发重绘）"""
+        if not self.selected_points:
+            return
         self.selected_points.clear()
         self.update_selection_info()
         self.update_chart()
@@ -1104,31 +2023,27 @@ class ScreenOCROrMonitor:
             
         if messagebox.askyesno("确认清空", "确定要清空所有通道的数据吗？"):
             # 清空数据队列
-            while True:
-                try:
-                    self.data_queue.get_nowait()
-                except queue.Empty:
-                    break
+            with self._data_lock:
+                self.data_queue.clear()
             
-            # 清空所有通道数据
+            # 清空所有通道数据（环形缓冲重置读写位置即可）
             for channel in self.channels:
-                channel['times'].clear()
-                channel['values'].clear()
+                channel['head'] = 0
+                channel['n'] = 0
+                channel['vmin'] = float('inf')
+                channel['vmax'] = float('-inf')
             
             # 清除选择
             self.selected_points.clear()
-            
+
             # 更新显示
-            self.update_current_values_display()
-            self.update_selection_info()
-            self.update_channels_display()
-            self.update_chart()
-            
+            self._refresh_all()
+
             print("[DEBUG] 所有通道数据已清空")
     
     def save_chart(self):
         """保存图表"""
-        if not hasattr(self, 'fig') or not any(len(channel['values']) > 0 for channel in self.channels):
+        if not hasattr(self, 'fig') or not any(channel['n'] > 0 for channel in self.channels):
             messagebox.showwarning("警告", "没有数据可保存")
             return
             
@@ -1140,14 +2055,32 @@ class ScreenOCROrMonitor:
         
         if filename:
             try:
-                self.fig.savefig(filename, dpi=300, bbox_inches='tight')
+                # 保存时临时取消animated标记，否则blit用的数据元素不会被savefig绘制
+                animated_artists = [self._selection_marker]
+                for artists in self._chart_artists.values():
+                    animated_artists.append(artists['line'])
+                for artist in animated_artists:
+                    artist.set_animated(False)
+                self._saving_chart = True
+                try:
+                    # 监控截图用150dpi足够：栅格化开销随dpi平方增长，
+                    # bbox_inches='tight'还要额外跑一遍排版来算边界，都省掉
+                    self.fig.savefig(filename, dpi=150)
+                finally:
+                    self._saving_chart = False
+                    for artist in animated_artists:
+                        artist.set_animated(True)
+                    # 保险起见让背景缓存失效：下一帧走完整重绘重建，
+                    # 避免任何导出期间的渲染状态残留到blit路径
+                    self._chart_bg = None
+                    self.canvas.draw_idle()
                 messagebox.showinfo("成功", f"图表已保存到: {filename}")
             except Exception as e:
                 messagebox.showerror("错误", f"保存失败: {e}")
     
     def save_csv(self):
         """导出CSV - 多通道版本"""
-        if not any(len(channel['values']) > 0 for channel in self.channels):
+        if not any(channel['n'] > 0 for channel in self.channels):
             messagebox.showwarning("警告", "没有数据可导出")
             return
             
@@ -1159,47 +2092,43 @@ class ScreenOCROrMonitor:
         
         if filename:
             try:
+                np = self.np
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                     writer = csv.writer(csvfile)
-                    
-                    # 写入表头
+
+                    # 各列的字符串整列向量化生成：时间列来自datetime64
+                    # 数组（np.datetime_as_string），数值列用np.char.mod
+                    # 一次格式化，替代逐格strftime/f-string
                     headers = ['时间']
+                    time_strs = None
+                    value_cols = []
                     for channel in self.channels:
-                        if channel['values']:
+                        if channel['n'] > 0:
                             headers.append(channel['name'])
-                    
+                            # 时间列（使用第一个有数据的通道的时间）
+                            if time_strs is None:
+                                t_arr = self._channel_times_arr(channel).astype('datetime64[s]')
+                                time_strs = np.char.replace(
+                                    np.datetime_as_string(t_arr), 'T', ' ').tolist()
+                            values = self._channel_series(channel)[1]
+                            value_cols.append(np.char.mod('%.2f', values).tolist())
+
                     writer.writerow(headers)
-                    
-                    # 找到所有通道的最大数据长度
-                    max_length = max(len(channel['times']) for channel in self.channels if channel['values'])
-                    
-                    # 写入数据
-                    for i in range(max_length):
-                        row = []
-                        
-                        # 时间列（使用第一个有数据的通道的时间）
-                        for channel in self.channels:
-                            if channel['times']:
-                                if i < len(channel['times']):
-                                    row.append(channel['times'][i].strftime('%Y-%m-%d %H:%M:%S'))
-                                else:
-                                    row.append('')
-                                break
-                        
-                        # 数值列
-                        for channel in self.channels:
-                            if channel['values']:
-                                if i < len(channel['values']):
-                                    row.append(f"{channel['values'][i]:.2f}")
-                                else:
-                                    row.append('')
-                        
-                        writer.writerow(row)
-                        
+                    # 各通道长度不齐时短列补空串，整批一次写出
+                    writer.writerows(itertools.zip_longest(time_strs, *value_cols,
+                                                           fillvalue=''))
+
                 messagebox.showinfo("成功", f"数据已导出到: {filename}")
             except Exception as e:
                 messagebox.showerror("错误", f"导出失败: {e}")
     
+    def on_close(self):
+        """窗口关闭：停止监控并释放OCR资源"""
+        self.monitoring = False
+        self._stop_ocr_executor()
+        self._shutdown_ocr_backend()
+        self.root.destroy()
+
     def run(self):
         """启动程序"""
         self.root.mainloop()